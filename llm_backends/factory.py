@@ -84,7 +84,7 @@ class ResponseCache:
             cached_response, timestamp = self.cache[key]
 
             # Check if expired
-            if time.time() - timestamp < self.ttl:
+            if time.monotonic() - timestamp < self.ttl:
                 logger.debug(f"Cache hit for key: {key[:8]}...")
                 return cached_response
 
@@ -103,7 +103,7 @@ class ResponseCache:
             response: Response content to cache
         """
         key = self._make_key(messages, model, temperature)
-        self.cache[key] = (response, time.time())
+        self.cache[key] = (response, time.monotonic())
         logger.debug(f"Cached response for key: {key[:8]}...")
 
     def clear(self) -> None:
@@ -5,22 +5,21 @@ This module provides enhanced EC2 instance scanning with caching,
 error handling, and multi-region support.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Iterator, Any
 import logging
+import sys
+from collections import defaultdict
 from functools import lru_cache
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
 from botocore.exceptions import ClientError, BotoCoreError
 
 from tagger_core.resource_scanner import (
     BaseResourceScanner,
     AWSResource,
     ScanResult,
-    ResourceType
+    ResourceType,
+    tags_to_aws_format,
+    tags_from_aws_format,
+    aws_retry
 )
 
 
@@ -53,11 +52,20 @@ class EC2Scanner(BaseResourceScanner):
         ```
     """
 
+    # DescribeInstances accepts at most 1000 results per page
+    MAX_RESULTS_PER_PAGE = 1000
+
+    # CreateTags accepts at most 1000 resource IDs per call
+    MAX_RESOURCES_PER_TAG_CALL = 1000
+
+    # Only one DescribeInstances page is prefetched at a time
+    MAX_WORKERS = 1
+
     @property
     def client(self):
         """Get or create EC2 client."""
         if self._client is None:
-            self._client = self.session.client('ec2')
+            self._client = self._create_client('ec2')
         return self._client
 
     def get_resource_type(self) -> ResourceType:
@@ -68,18 +76,19 @@ class EC2Scanner(BaseResourceScanner):
         """
         return ResourceType.EC2
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ClientError),
-        reraise=True
-    )
-    def scan(self, state_filter: Optional[List[str]] = None) -> ScanResult:
+    def scan(
+        self,
+        state_filter: Optional[List[str]] = None,
+        tag_filter: Optional[Dict[str, List[str]]] = None
+    ) -> ScanResult:
         """Scan for EC2 instances in the region.
 
         Args:
             state_filter: Optional list of instance states to filter by
                           (e.g., ['running', 'stopped']). If None, scans all states.
+            tag_filter: Optional mapping of tag key to accepted values, applied
+                        server-side (e.g., {'Environment': ['production']}).
+                        Only instances matching every key are returned.
 
         Returns:
             ScanResult containing all found instances
@@ -88,56 +97,111 @@ class EC2Scanner(BaseResourceScanner):
             ClientError: If the AWS API call fails after retries
         """
         try:
-            logger.info(f"Scanning EC2 instances in {self.region}")
-
-            # Build filters
-            filters = []
-            if state_filter:
-                filters.append({
-                    'Name': 'instance-state-name',
-                    'Values': state_filter
-                })
-
-            # Describe instances
-            if filters:
-                response = self.client.describe_instances(Filters=filters)
-            else:
-                response = self.client.describe_instances()
+            logger.info("Scanning EC2 instances in %s", self.region)
 
-            # Parse instances
-            instances = []
-            for reservation in response.get('Reservations', []):
-                for instance_data in reservation.get('Instances', []):
-                    instance = self._parse_instance(instance_data)
-                    instances.append(instance)
+            instances = list(self.iter_instances(state_filter, tag_filter))
 
-            # Separate tagged and untagged
-            tagged = [i for i in instances if i.is_tagged]
-            untagged = [i for i in instances if not i.is_tagged]
-
-            logger.info(
-                f"EC2 scan complete: {len(instances)} total, "
-                f"{len(untagged)} untagged"
-            )
+            logger.info("EC2 scan complete: %d instances", len(instances))
 
             return ScanResult(
                 resource_type=ResourceType.EC2,
                 region=self.region,
-                total_resources=len(instances),
-                tagged_resources=tagged,
-                untagged_resources=untagged,
                 resources=instances
             )
 
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            logger.error(f"EC2 scan failed: {error_code} - {str(e)}")
+            logger.error("EC2 scan failed: %s - %s", error_code, e)
             raise
 
         except Exception as e:
-            logger.error(f"Unexpected error during EC2 scan: {str(e)}")
+            logger.error("Unexpected error during EC2 scan: %s", e)
             raise
 
+    def scan_iter(self) -> Iterator[AWSResource]:
+        """Yield every EC2 instance in the region as each page arrives.
+
+        Yields:
+            AWSResource for each instance
+
+        Raises:
+            ClientError: If the AWS API call fails after retries
+        """
+        return self.iter_instances()
+
+    def iter_instances(
+        self,
+        state_filter: Optional[List[str]] = None,
+        tag_filter: Optional[Dict[str, List[str]]] = None
+    ) -> Iterator[AWSResource]:
+        """Yield EC2 instances in the region as each page arrives.
+
+        Unlike scan(), this does not hold the whole fleet in memory or wait
+        for the last page before returning the first instance.
+
+        Args:
+            state_filter: Optional list of instance states to filter by
+            tag_filter: Optional mapping of tag key to accepted values
+
+        Yields:
+            AWSResource for each instance
+
+        Raises:
+            ClientError: If the AWS API call fails after retries
+        """
+        # Build filters
+        filters = []
+        if state_filter:
+            filters.append({
+                'Name': 'instance-state-name',
+                'Values': state_filter
+            })
+        for tag_key, tag_values in (tag_filter or {}).items():
+            filters.append({
+                'Name': f'tag:{tag_key}',
+                'Values': tag_values
+            })
+
+        for response in self._describe_instance_pages(filters):
+            for reservation in response.get('Reservations', []):
+                for instance_data in reservation.get('Instances', []):
+                    yield self._parse_instance(instance_data)
+
+    def _describe_instance_pages(self, filters: List[Dict]) -> Iterator[Dict[str, Any]]:
+        """Yield DescribeInstances response pages.
+
+        Pages must be requested in order because each one carries the
+        NextToken for the next, but the request for page N+1 is issued on a
+        background thread while the caller parses page N, so network latency
+        overlaps with parsing instead of adding to it.
+
+        Args:
+            filters: DescribeInstances filters (may be empty)
+
+        Yields:
+            Raw DescribeInstances responses
+        """
+        request = {'MaxResults': self.MAX_RESULTS_PER_PAGE}
+        if filters:
+            request['Filters'] = filters
+
+        executor = self._get_executor()
+        future = executor.submit(self.client.describe_instances, **request)
+        while future is not None:
+            response = future.result()
+
+            next_token = response.get('NextToken')
+            if next_token:
+                future = executor.submit(
+                    self.client.describe_instances,
+                    NextToken=next_token,
+                    **request
+                )
+            else:
+                future = None
+
+            yield response
+
     def _parse_instance(self, instance_data: Dict) -> AWSResource:
         """Parse EC2 instance data into AWSResource object.
 
@@ -148,23 +212,24 @@ class EC2Scanner(BaseResourceScanner):
             AWSResource object
         """
         instance_id = instance_data['InstanceId']
-        state = instance_data['State']['Name']
+        # States, types, zones and platforms come from a small vocabulary;
+        # interning keeps one copy of each instead of one per instance
+        state = sys.intern(instance_data['State']['Name'])
+        instance_type = instance_data.get('InstanceType')
+        availability_zone = instance_data.get('Placement', {}).get('AvailabilityZone')
 
-        # Parse tags
-        tags = {}
-        for tag in instance_data.get('Tags', []):
-            tags[tag['Key']] = tag['Value']
+        tags = tags_from_aws_format(instance_data.get('Tags', ()))
 
         # Collect metadata
         metadata = {
-            'instance_type': instance_data.get('InstanceType'),
+            'instance_type': sys.intern(instance_type) if instance_type else None,
             'launch_time': instance_data.get('LaunchTime').isoformat() if instance_data.get('LaunchTime') else None,
-            'availability_zone': instance_data.get('Placement', {}).get('AvailabilityZone'),
+            'availability_zone': sys.intern(availability_zone) if availability_zone else None,
             'vpc_id': instance_data.get('VpcId'),
             'subnet_id': instance_data.get('SubnetId'),
             'private_ip': instance_data.get('PrivateIpAddress'),
             'public_ip': instance_data.get('PublicIpAddress'),
-            'platform': instance_data.get('Platform', 'linux'),
+            'platform': sys.intern(instance_data.get('Platform', 'linux')),
         }
 
         # Add name tag to metadata if present
@@ -180,12 +245,7 @@ class EC2Scanner(BaseResourceScanner):
             metadata=metadata
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ClientError),
-        reraise=True
-    )
+    @aws_retry
     def apply_tags(
         self,
         resource_id: str,
@@ -207,7 +267,7 @@ class EC2Scanner(BaseResourceScanner):
         """
         try:
             # Convert tags to AWS format
-            aws_tags = [{"Key": k, "Value": v} for k, v in tags.items()]
+            aws_tags = tags_to_aws_format(tags)
 
             # Apply tags
             self.client.create_tags(
@@ -217,18 +277,90 @@ class EC2Scanner(BaseResourceScanner):
             )
 
             if not dry_run:
-                logger.info(f"Successfully tagged EC2 instance {resource_id} with {len(tags)} tags")
+                logger.info("Successfully tagged EC2 instance %s with %d tags", resource_id, len(tags))
 
             return True
 
         except ClientError as e:
             if dry_run and e.response.get('Error', {}).get('Code') == 'DryRunOperation':
                 # Dry run succeeded (would have worked)
-                logger.info(f"Dry run successful for {resource_id}")
+                logger.info("Dry run successful for %s", resource_id)
                 return True
 
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            logger.error(f"Failed to tag EC2 instance {resource_id}: {error_code} - {str(e)}")
+            logger.error("Failed to tag EC2 instance %s: %s - %s", resource_id, error_code, e)
+            raise
+
+    def apply_tags_bulk(
+        self,
+        updates: Dict[str, Dict[str, str]],
+        dry_run: bool = False
+    ) -> Dict[str, bool]:
+        """Apply tags to many EC2 instances with as few API calls as possible.
+
+        Instances that receive an identical tag set are grouped and tagged
+        together, up to 1000 instances per CreateTags call. If a call fails,
+        every instance in that call is reported as failed.
+
+        Args:
+            updates: Mapping of instance ID to the tags to apply
+            dry_run: If True, validate without actually applying tags
+
+        Returns:
+            Mapping of instance ID to True if tagging succeeded
+        """
+        groups: Dict[Tuple[Tuple[str, str], ...], List[str]] = defaultdict(list)
+        for resource_id, tags in updates.items():
+            groups[tuple(sorted(tags.items()))].append(resource_id)
+
+        results = {}
+        for tag_items, resource_ids in groups.items():
+            for start in range(0, len(resource_ids), self.MAX_RESOURCES_PER_TAG_CALL):
+                batch = resource_ids[start:start + self.MAX_RESOURCES_PER_TAG_CALL]
+                try:
+                    self._create_tags_batch(batch, dict(tag_items), dry_run)
+                    succeeded = True
+                except ClientError as e:
+                    error_code = e.response.get('Error', {}).get('Code', 'Unknown')
+                    logger.error(
+                        "Failed to tag %d EC2 instances: %s - %s",
+                        len(batch), error_code, e
+                    )
+                    succeeded = False
+                results.update(dict.fromkeys(batch, succeeded))
+
+        logger.info(
+            "Bulk tagged %d EC2 instances in %d tag groups",
+            sum(results.values()), len(groups)
+        )
+        return results
+
+    @aws_retry
+    def _create_tags_batch(
+        self,
+        resource_ids: List[str],
+        tags: Dict[str, str],
+        dry_run: bool
+    ) -> None:
+        """Issue one CreateTags call for a batch of instances.
+
+        Args:
+            resource_ids: Up to 1000 EC2 instance IDs
+            tags: Dictionary of tags to apply
+            dry_run: If True, validate without actually applying tags
+
+        Raises:
+            ClientError: If tagging fails
+        """
+        try:
+            self.client.create_tags(
+                Resources=resource_ids,
+                Tags=tags_to_aws_format(tags),
+                DryRun=dry_run
+            )
+        except ClientError as e:
+            if dry_run and e.response.get('Error', {}).get('Code') == 'DryRunOperation':
+                return
             raise
 
     def scan_running_only(self) -> ScanResult:
@@ -255,3 +387,18 @@ class EC2Scanner(BaseResourceScanner):
         """
         result = self.scan_running_only()
         return result.untagged_resources
+
+    def get_instances_by_tag(self, tag_key: str, tag_value: str) -> List[AWSResource]:
+        """Get EC2 instances with a specific tag.
+
+        The tag match is pushed to DescribeInstances as a filter, so only
+        matching instances are returned by AWS.
+
+        Args:
+            tag_key: Tag key to search for
+            tag_value: Tag value to match
+
+        Returns:
+            List of instances with the specified tag
+        """
+        return list(self.iter_instances(tag_filter={tag_key: [tag_value]}))
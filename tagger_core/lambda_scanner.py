@@ -5,27 +5,37 @@ This module provides Lambda function scanning with caching,
 error handling, and comprehensive tag management.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Mapping, Tuple, FrozenSet, Iterable, Iterator
 import logging
-from functools import lru_cache
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
+import math
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cached_property, lru_cache, partial
+from operator import itemgetter
+import boto3
 from botocore.exceptions import ClientError
 
 from tagger_core.resource_scanner import (
     BaseResourceScanner,
     AWSResource,
     ScanResult,
-    ResourceType
+    ResourceType,
+    LazyTags,
+    tags_from_aws_format,
+    DEFAULT_CLIENT_CONFIG,
+    aws_retry
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Function configuration fields copied into metadata. Zip-packaged functions
+# have all of them, so one C-level itemgetter call replaces seven dict.get
+# calls; functions missing any (e.g. container images) fall back to .get.
+_METADATA_FIELDS = ('Runtime', 'Handler', 'CodeSize', 'MemorySize', 'Timeout', 'LastModified', 'Role')
+_get_metadata_fields = itemgetter(*_METADATA_FIELDS)
+
 
 class LambdaScanner(BaseResourceScanner):
     """Scanner for AWS Lambda functions.
@@ -45,22 +55,70 @@ class LambdaScanner(BaseResourceScanner):
         print(f"Untagged: {len(result.untagged_resources)}")
 
         # Tag untagged functions
-        for function in result.untagged_resources:
-            scanner.apply_tags(function.metadata['arn'], {
+        scanner.apply_tags_bulk({
+            function.metadata['arn']: {
                 "Environment": "production",
                 "ManagedBy": "aws-tagsense",
                 "CostCenter": "engineering"
-            })
+            }
+            for function in result.untagged_resources
+        })
         ```
     """
 
+    # ListFunctions returns at most 50 functions per page
+    MAX_ITEMS_PER_PAGE = 50
+
+    # Concurrent ListTags calls per scan (the worker pool is also capped at
+    # the client's max_pool_connections so workers never wait on a connection)
+    MAX_WORKERS = 32
+
+    # Concurrent TagResource calls in apply_tags_bulk
+    MAX_TAG_APPLY_WORKERS = 16
+
+    # GetResources returns at most 100 resources per page
+    MAX_TAGGING_RESULTS_PER_PAGE = 100
+
+    # Runtimes matched by the scan_python_only / scan_nodejs_only shortcuts
+    PYTHON_RUNTIMES = frozenset({'python3.9', 'python3.10', 'python3.11', 'python3.12'})
+    NODEJS_RUNTIMES = frozenset({'nodejs18.x', 'nodejs20.x'})
+
+    # Seconds a scan result is reused by repeat scans on the same scanner
+    SCAN_CACHE_TTL = 60
+
+    def __init__(
+        self,
+        region: str,
+        profile: Optional[str] = None,
+        session: Optional[boto3.Session] = None
+    ):
+        """Initialize the Lambda scanner.
+
+        Args:
+            region: AWS region to scan
+            profile: AWS profile name (optional)
+            session: Existing boto3 session to reuse (optional)
+        """
+        super().__init__(region, profile=profile, session=session)
+        self._scan_cache: Dict[Optional[FrozenSet[str]], Tuple[ScanResult, float]] = {}
+
     @property
     def client(self):
         """Get or create Lambda client."""
         if self._client is None:
-            self._client = self.session.client('lambda')
+            self._client = self._create_client('lambda')
         return self._client
 
+    @cached_property
+    def _list_functions_paginator(self):
+        """ListFunctions paginator, built once and reused by every scan."""
+        return self.client.get_paginator('list_functions')
+
+    @cached_property
+    def _get_resources_paginator(self):
+        """Tagging API GetResources paginator, built once and reused."""
+        return self._create_client('resourcegroupstaggingapi').get_paginator('get_resources')
+
     def get_resource_type(self) -> ResourceType:
         """Get the resource type.
 
@@ -69,18 +127,21 @@ class LambdaScanner(BaseResourceScanner):
         """
         return ResourceType.LAMBDA
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ClientError),
-        reraise=True
-    )
-    def scan(self, runtime_filter: Optional[List[str]] = None) -> ScanResult:
+    def scan(
+        self,
+        runtime_filter: Optional[Iterable[str]] = None,
+        use_cache: bool = True
+    ) -> ScanResult:
         """Scan for Lambda functions in the region.
 
+        Results are cached on the scanner for SCAN_CACHE_TTL seconds, so
+        repeated scans do not re-list every function and re-fetch every
+        tag set.
+
         Args:
-            runtime_filter: Optional list of runtimes to filter by
+            runtime_filter: Optional collection of runtimes to filter by
                            (e.g., ['python3.11', 'nodejs18.x']). If None, scans all runtimes.
+            use_cache: If False, always scan AWS and refresh the cache
 
         Returns:
             ScanResult containing all found Lambda functions
@@ -88,65 +149,337 @@ class LambdaScanner(BaseResourceScanner):
         Raises:
             ClientError: If the AWS API call fails after retries
         """
+        runtime_set = frozenset(runtime_filter) if runtime_filter else None
+        if use_cache and runtime_set in self._scan_cache:
+            cached_result, timestamp = self._scan_cache[runtime_set]
+            if time.monotonic() - timestamp < self.SCAN_CACHE_TTL:
+                logger.debug("Using cached Lambda scan for %s", self.region)
+                return cached_result
+
         try:
-            logger.info(f"Scanning Lambda functions in {self.region}")
-
-            functions = []
-            marker = None
-
-            # Lambda API is paginated
-            while True:
-                if marker:
-                    response = self.client.list_functions(Marker=marker)
-                else:
-                    response = self.client.list_functions()
-
-                # Parse functions
-                for function_data in response.get('Functions', []):
-                    # Apply runtime filter if specified
-                    if runtime_filter and function_data.get('Runtime') not in runtime_filter:
-                        continue
-
-                    function = self._parse_function(function_data)
-                    functions.append(function)
-
-                # Check for more pages
-                marker = response.get('NextMarker')
-                if not marker:
-                    break
-
-            # Separate tagged and untagged
-            tagged = [f for f in functions if f.is_tagged]
-            untagged = [f for f in functions if not f.is_tagged]
-
-            logger.info(
-                f"Lambda scan complete: {len(functions)} total, "
-                f"{len(untagged)} untagged"
-            )
+            logger.info("Scanning Lambda functions in %s", self.region)
+
+            all_configs = self._list_function_configs()
+            function_configs = self._filter_by_runtime(all_configs, runtime_set)
+
+            # Tags are fetched only for functions that passed the filter
+            all_tags = self._fetch_tags_for(function_configs, len(all_configs))
 
-            return ScanResult(
+            functions = [
+                self._parse_function(function_data, tags)
+                for function_data, tags in zip(function_configs, all_tags)
+            ]
+
+            logger.info("Lambda scan complete: %d functions", len(functions))
+
+            result = ScanResult(
                 resource_type=ResourceType.LAMBDA,
                 region=self.region,
-                total_resources=len(functions),
-                tagged_resources=tagged,
-                untagged_resources=untagged,
                 resources=functions
             )
+            self._scan_cache[runtime_set] = (result, time.monotonic())
+            return result
 
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            logger.error(f"Lambda scan failed: {error_code} - {str(e)}")
+            logger.error("Lambda scan failed: %s - %s", error_code, e)
             raise
 
         except Exception as e:
-            logger.error(f"Unexpected error during Lambda scan: {str(e)}")
+            logger.error("Unexpected error during Lambda scan: %s", e)
             raise
 
-    def _parse_function(self, function_data: Dict) -> AWSResource:
+    def invalidate_cache(self) -> None:
+        """Drop cached scan results so the next scan queries AWS."""
+        self._scan_cache.clear()
+
+    def discover_functions(
+        self,
+        runtime_filter: Optional[Iterable[str]] = None
+    ) -> List[AWSResource]:
+        """Discover Lambda functions without fetching their tags up front.
+
+        Each function's tags are fetched the first time they are read, so
+        callers that only need names and metadata skip the per-function
+        ListTags call entirely. Use scan() when tags are needed for every
+        function, since it fetches them concurrently.
+
+        Args:
+            runtime_filter: Optional collection of runtimes to filter by
+
+        Returns:
+            List of functions whose tags are LazyTags mappings
+
+        Raises:
+            ClientError: If the AWS API call fails after retries
+        """
+        runtime_set = frozenset(runtime_filter) if runtime_filter else None
+        return [
+            self._parse_function(
+                function_data,
+                LazyTags(partial(self._fetch_tags, function_data))
+            )
+            for function_data in self._list_function_configs(runtime_set)
+        ]
+
+    def scan_iter(self) -> Iterator[AWSResource]:
+        """Yield every Lambda function in the region as each page arrives.
+
+        Yields:
+            AWSResource for each function
+
+        Raises:
+            ClientError: If the AWS API call fails after retries
+        """
+        return self.iter_functions()
+
+    def iter_functions(
+        self,
+        runtime_filter: Optional[Iterable[str]] = None,
+        tag_filter: Optional[Dict[str, List[str]]] = None
+    ) -> Iterator[AWSResource]:
+        """Yield Lambda functions as each ListFunctions page arrives.
+
+        Unlike scan(), this does not hold every function in memory, partition
+        them, or use the scan cache. Tags come from one bulk GetResources
+        lookup made up front, which also applies the tag filter server-side;
+        if that lookup is not permitted, each page's tags are fetched with
+        ListTags and the tag filter is applied locally.
+
+        Args:
+            runtime_filter: Optional collection of runtimes to filter by
+            tag_filter: Optional mapping of tag key to accepted values
+                        (e.g., {'Environment': ['production']}). Only
+                        functions matching every key are yielded.
+
+        Yields:
+            AWSResource for each function
+
+        Raises:
+            ClientError: If the AWS API call fails after retries
+        """
+        runtime_set = frozenset(runtime_filter) if runtime_filter else None
+
+        # The bulk tag lookup and the function listing are independent, so
+        # the lookup runs in the background while the first page is listed
+        tags_future = self._get_executor().submit(self._fetch_all_tags, tag_filter)
+        tags_by_arn = None
+
+        for page_configs in self._iter_function_pages(prefetch=True):
+            if tags_future is not None:
+                tags_by_arn = tags_future.result()
+                tags_future = None
+
+            function_configs = self._filter_by_runtime(page_configs, runtime_set)
+
+            if tags_by_arn is not None:
+                for function_data in function_configs:
+                    tags = tags_by_arn.get(function_data['FunctionArn'])
+                    if tags is None:
+                        # Not tagged, or filtered out by the tag filter
+                        if tag_filter:
+                            continue
+                        tags = {}
+                    yield self._parse_function(function_data, tags)
+                continue
+
+            all_tags = self._list_tags_concurrently(function_configs)
+            for function_data, tags in zip(function_configs, all_tags):
+                if tag_filter and not all(
+                    tags.get(key) in values for key, values in tag_filter.items()
+                ):
+                    continue
+                yield self._parse_function(function_data, tags)
+
+    def _iter_function_pages(self, prefetch: bool = False) -> Iterator[List[Dict]]:
+        """Yield the raw function configurations of each ListFunctions page.
+
+        Args:
+            prefetch: If True, request page N+1 on the worker pool while the
+                      caller processes page N (pages still arrive in order)
+
+        Yields:
+            List of raw function data from AWS API, one list per page
+        """
+        # Lambda API is paginated
+        pages = iter(self._list_functions_paginator.paginate(
+            PaginationConfig={'PageSize': self.MAX_ITEMS_PER_PAGE}
+        ))
+
+        if not prefetch:
+            for page in pages:
+                yield page.get('Functions', [])
+            return
+
+        # Only one next() is ever in flight, so the paginator is never
+        # advanced from two threads at once
+        executor = self._get_executor()
+        future = executor.submit(next, pages, None)
+        while True:
+            page = future.result()
+            if page is None:
+                return
+            future = executor.submit(next, pages, None)
+            yield page.get('Functions', [])
+
+    def _list_function_configs(
+        self,
+        runtime_set: Optional[FrozenSet[str]] = None
+    ) -> List[Dict]:
+        """List raw function configurations, applying the runtime filter.
+
+        Args:
+            runtime_set: Optional set of runtimes to keep
+
+        Returns:
+            List of raw function data from AWS API
+        """
+        function_configs = []
+        for page_configs in self._iter_function_pages():
+            function_configs.extend(page_configs)
+
+        return self._filter_by_runtime(function_configs, runtime_set)
+
+    @staticmethod
+    def _filter_by_runtime(
+        function_configs: List[Dict],
+        runtime_set: Optional[FrozenSet[str]] = None
+    ) -> List[Dict]:
+        """Keep only functions whose runtime is in the filter.
+
+        Args:
+            function_configs: Raw function data from AWS API
+            runtime_set: Optional set of runtimes to keep (None keeps all)
+
+        Returns:
+            Matching function data, in the original order
+        """
+        if runtime_set is None:
+            return function_configs
+        return [
+            function_data for function_data in function_configs
+            if function_data.get('Runtime') in runtime_set
+        ]
+
+    def _fetch_tags_for(
+        self,
+        function_configs: List[Dict],
+        total_functions: int
+    ) -> List[Dict[str, str]]:
+        """Fetch tags for the given functions using the cheapest API.
+
+        A bulk GetResources lookup costs one call per 100 functions in the
+        whole region, however few of them are wanted, so it is only used when
+        that is fewer calls than one ListTags per function. Runtime-filtered
+        scans that keep a handful of functions use ListTags instead.
+
+        Args:
+            function_configs: Raw function data for the functions to tag
+            total_functions: Number of functions in the region
+
+        Returns:
+            Tags for each function, in the same order as function_configs
+        """
+        if not function_configs:
+            return []
+
+        bulk_calls = math.ceil(total_functions / self.MAX_TAGGING_RESULTS_PER_PAGE)
+        if len(function_configs) > bulk_calls:
+            tags_by_arn = self._fetch_all_tags()
+            if tags_by_arn is not None:
+                # GetResources omits functions that have never been
+                # tagged, so a missing ARN simply means no tags
+                return [
+                    tags_by_arn.get(function_data['FunctionArn'], {})
+                    for function_data in function_configs
+                ]
+
+        return self._list_tags_concurrently(function_configs)
+
+    def _list_tags_concurrently(self, function_configs: List[Dict]) -> List[Dict[str, str]]:
+        """Fetch tags with one ListTags call per function, run concurrently.
+
+        Args:
+            function_configs: Raw function data for the functions to tag
+
+        Returns:
+            Tags for each function, in the same order as function_configs
+        """
+        if not function_configs:
+            return []
+
+        return list(self._get_executor().map(self._fetch_tags, function_configs))
+
+    def _fetch_all_tags(
+        self,
+        tag_filter: Optional[Dict[str, List[str]]] = None
+    ) -> Optional[Dict[str, Dict[str, str]]]:
+        """Fetch the tags of every Lambda function in the region in bulk.
+
+        The Resource Groups Tagging API returns tags for up to 100 functions
+        per call, versus one ListTags call per function.
+
+        Args:
+            tag_filter: Optional mapping of tag key to accepted values; only
+                        functions matching every key are returned
+
+        Returns:
+            Mapping of function ARN to its tags, or None if the tagging API
+            could not be used (e.g. tag:GetResources is not permitted)
+        """
+        request = {
+            'ResourceTypeFilters': ['lambda:function'],
+            'ResourcesPerPage': self.MAX_TAGGING_RESULTS_PER_PAGE
+        }
+        if tag_filter:
+            request['TagFilters'] = [
+                {'Key': tag_key, 'Values': tag_values}
+                for tag_key, tag_values in tag_filter.items()
+            ]
+
+        try:
+            pages = self._get_resources_paginator.paginate(**request)
+
+            tags_by_arn = {}
+            for page in pages:
+                for mapping in page.get('ResourceTagMappingList', []):
+                    tags_by_arn[mapping['ResourceARN']] = tags_from_aws_format(
+                        mapping.get('Tags', ())
+                    )
+            return tags_by_arn
+
+        except ClientError as e:
+            logger.warning(
+                "Bulk tag lookup failed in %s, falling back to ListTags: %s",
+                self.region, e
+            )
+            return None
+
+    def _fetch_tags(self, function_data: Dict) -> Dict[str, str]:
+        """Fetch the tags of a Lambda function.
+
+        Lambda stores tags separately from the function configuration.
+        Safe to call from worker threads, since boto3 clients are thread-safe.
+
+        Args:
+            function_data: Raw function data from AWS API
+
+        Returns:
+            Dictionary of tags, empty if they could not be fetched
+        """
+        try:
+            tags_response = self.client.list_tags(Resource=function_data['FunctionArn'])
+            return tags_response.get('Tags', {})
+        except ClientError as e:
+            logger.warning("Could not fetch tags for %s: %s", function_data['FunctionName'], e)
+            return {}
+
+    def _parse_function(self, function_data: Dict, tags: Mapping[str, str]) -> AWSResource:
         """Parse Lambda function data into AWSResource object.
 
         Args:
             function_data: Raw function data from AWS API
+            tags: Tags for the function (eager dict or LazyTags)
 
         Returns:
             AWSResource object
@@ -154,27 +487,34 @@ class LambdaScanner(BaseResourceScanner):
         function_name = function_data['FunctionName']
         function_arn = function_data['FunctionArn']
 
-        # Parse tags (Lambda stores tags separately from function config)
-        tags = {}
         try:
-            tags_response = self.client.list_tags(Resource=function_arn)
-            tags = tags_response.get('Tags', {})
-        except ClientError as e:
-            logger.warning(f"Could not fetch tags for {function_name}: {str(e)}")
+            (runtime, handler, code_size, memory_size,
+             timeout, last_modified, role) = _get_metadata_fields(function_data)
+        except KeyError:
+            (runtime, handler, code_size, memory_size,
+             timeout, last_modified, role) = map(function_data.get, _METADATA_FIELDS)
+
+        # Runtimes, package types and execution roles repeat across most
+        # functions; interning stores each distinct value once
+        package_type = function_data.get('PackageType', 'Zip')
+        if runtime:
+            runtime = sys.intern(runtime)
+        if role:
+            role = sys.intern(role)
 
         # Collect metadata
         metadata = {
             'arn': function_arn,
-            'runtime': function_data.get('Runtime'),
-            'handler': function_data.get('Handler'),
-            'code_size': function_data.get('CodeSize'),
-            'memory_size': function_data.get('MemorySize'),
-            'timeout': function_data.get('Timeout'),
-            'last_modified': function_data.get('LastModified'),
-            'role': function_data.get('Role'),
+            'runtime': runtime,
+            'handler': handler,
+            'code_size': code_size,
+            'memory_size': memory_size,
+            'timeout': timeout,
+            'last_modified': last_modified,
+            'role': role,
             'description': function_data.get('Description', ''),
             'architectures': function_data.get('Architectures', []),
-            'package_type': function_data.get('PackageType', 'Zip'),
+            'package_type': sys.intern(package_type),
         }
 
         # Lambda functions don't have a traditional "state" like EC2
@@ -190,12 +530,7 @@ class LambdaScanner(BaseResourceScanner):
             metadata=metadata
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(ClientError),
-        reraise=True
-    )
+    @aws_retry
     def apply_tags(
         self,
         resource_arn: str,  # Lambda uses ARN, not resource_id
@@ -216,7 +551,7 @@ class LambdaScanner(BaseResourceScanner):
             ClientError: If tagging fails
         """
         if dry_run:
-            logger.info(f"Dry run: would tag Lambda function {resource_arn} with {len(tags)} tags")
+            logger.info("Dry run: would tag Lambda function %s with %d tags", resource_arn, len(tags))
             return True
 
         try:
@@ -225,15 +560,62 @@ class LambdaScanner(BaseResourceScanner):
                 Resource=resource_arn,
                 Tags=tags
             )
+            self.invalidate_cache()
 
-            logger.info(f"Successfully tagged Lambda function {resource_arn} with {len(tags)} tags")
+            logger.info("Successfully tagged Lambda function %s with %d tags", resource_arn, len(tags))
             return True
 
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            logger.error(f"Failed to tag Lambda function {resource_arn}: {error_code} - {str(e)}")
+            logger.error("Failed to tag Lambda function %s: %s - %s", resource_arn, error_code, e)
             raise
 
+    def apply_tags_bulk(
+        self,
+        updates: Dict[str, Dict[str, str]],
+        dry_run: bool = False
+    ) -> Dict[str, bool]:
+        """Apply tags to many Lambda functions concurrently.
+
+        Lambda's TagResource takes a single function, so the calls are spread
+        over a thread pool instead of being made one after another. Each call
+        keeps apply_tags' retry behaviour.
+
+        Args:
+            updates: Mapping of function ARN to the tags to apply
+            dry_run: If True, validate without actually applying tags
+
+        Returns:
+            Mapping of function ARN to True if tagging succeeded
+        """
+        if not updates:
+            return {}
+
+        results = {}
+        max_workers = min(
+            self.MAX_TAG_APPLY_WORKERS,
+            DEFAULT_CLIENT_CONFIG.max_pool_connections,
+            len(updates)
+        )
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.apply_tags, resource_arn, tags, dry_run): resource_arn
+                for resource_arn, tags in updates.items()
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except ClientError:
+                    # apply_tags has already logged the failure
+                    results[futures[future]] = False
+
+        logger.info(
+            "Bulk tagged %d of %d Lambda functions",
+            sum(results.values()), len(updates)
+        )
+        # Report in the caller's order rather than completion order
+        return {resource_arn: results[resource_arn] for resource_arn in updates}
+
     def remove_tags(self, resource_arn: str, tag_keys: List[str]) -> bool:
         """Remove specific tags from a Lambda function.
 
@@ -252,13 +634,14 @@ class LambdaScanner(BaseResourceScanner):
                 Resource=resource_arn,
                 TagKeys=tag_keys
             )
+            self.invalidate_cache()
 
-            logger.info(f"Successfully removed {len(tag_keys)} tags from {resource_arn}")
+            logger.info("Successfully removed %d tags from %s", len(tag_keys), resource_arn)
             return True
 
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
-            logger.error(f"Failed to remove tags from {resource_arn}: {error_code} - {str(e)}")
+            logger.error("Failed to remove tags from %s: %s - %s", resource_arn, error_code, e)
             raise
 
     def scan_python_only(self) -> ScanResult:
@@ -267,8 +650,7 @@ class LambdaScanner(BaseResourceScanner):
         Returns:
             ScanResult for Python functions
         """
-        python_runtimes = ['python3.9', 'python3.10', 'python3.11', 'python3.12']
-        return self.scan(runtime_filter=python_runtimes)
+        return self.scan(runtime_filter=self.PYTHON_RUNTIMES)
 
     def scan_nodejs_only(self) -> ScanResult:
         """Convenience method to scan only Node.js Lambda functions.
@@ -276,12 +658,14 @@ class LambdaScanner(BaseResourceScanner):
         Returns:
             ScanResult for Node.js functions
         """
-        nodejs_runtimes = ['nodejs18.x', 'nodejs20.x']
-        return self.scan(runtime_filter=nodejs_runtimes)
+        return self.scan(runtime_filter=self.NODEJS_RUNTIMES)
 
     def get_functions_by_tag(self, tag_key: str, tag_value: str) -> List[AWSResource]:
         """Get Lambda functions with a specific tag.
 
+        The tag match is pushed to GetResources as a tag filter, so only
+        matching functions' tags are returned by AWS.
+
         Args:
             tag_key: Tag key to search for
             tag_value: Tag value to match
@@ -289,8 +673,4 @@ class LambdaScanner(BaseResourceScanner):
         Returns:
             List of functions with the specified tag
         """
-        result = self.scan()
-        return [
-            func for func in result.resources
-            if func.tags.get(tag_key) == tag_value
-        ]
+        return list(self.iter_functions(tag_filter={tag_key: [tag_value]}))
@@ -1,41 +1,162 @@
 import os
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from openai.types.chat import ChatCompletionUserMessageParam, ChatCompletionSystemMessageParam
 
 load_dotenv()
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Answers to repeated prompts are reused for a day; above this temperature
+# answers are meant to vary, so they are never cached
+_CACHE_TTL = 86400
+_CACHE_MAX_ENTRIES = 256
+_CACHE_MAX_TEMPERATURE = 0.7
 
-test_response = client.chat.completions.create(
-    model="gpt-3.5-turbo",
-    messages = [
-        ChatCompletionSystemMessageParam(role="system", content="You are a helpful assistant."),
-        ChatCompletionUserMessageParam(role="user", content="Hello! What is tagging in AWS?")
-    ],
-    temperature=0.5
-)
+_response_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_response_cache_lock = threading.Lock()
 
-print(test_response.choices[0].message.content.strip())
 
-models = client.models.list()
-for m in models.data:
-    print(m.id)
+@lru_cache(maxsize=1)
+def _get_client() -> OpenAI:
+    # Built on first use so importing this module makes no network calls
+    return OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-def ask_gpt(prompt: str, context: str = "", model: str = "gpt-3.5-turbo", temperature: float = 0.3) -> str:
-    try:
+
+def healthcheck() -> None:
+    client = _get_client()
+
+    test_response = client.chat.completions.create(
+        model="gpt-3.5-turbo",
         messages = [
             ChatCompletionSystemMessageParam(role="system", content="You are a helpful assistant."),
-            ChatCompletionUserMessageParam(role="user", content=prompt)
-        ]
+            ChatCompletionUserMessageParam(role="user", content="Hello! What is tagging in AWS?")
+        ],
+        temperature=0.5
+    )
+
+    print(test_response.choices[0].message.content.strip())
+
+    models = client.models.list()
+    for m in models.data:
+        print(m.id)
+
+def _cache_key(prompt: str, context: str, model: str, temperature: float) -> Optional[str]:
+    if temperature > _CACHE_MAX_TEMPERATURE:
+        return None
+    return hashlib.sha256(f"{model}|{temperature}|{prompt}|{context}".encode()).hexdigest()
+
+def _cache_get(key: Optional[str]) -> Optional[str]:
+    if key is None:
+        return None
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+        if entry is None:
+            return None
+        answer, timestamp = entry
+        if time.monotonic() - timestamp >= _CACHE_TTL:
+            del _response_cache[key]
+            return None
+        _response_cache.move_to_end(key)
+        return answer
+
+def _cache_set(key: Optional[str], answer: str) -> None:
+    if key is None:
+        return
+    with _response_cache_lock:
+        _response_cache[key] = (answer, time.monotonic())
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _CACHE_MAX_ENTRIES:
+            _response_cache.popitem(last=False)
+
+def clear_cache() -> None:
+    with _response_cache_lock:
+        _response_cache.clear()
+
+def _build_messages(prompt: str):
+    return [
+        ChatCompletionSystemMessageParam(role="system", content="You are a helpful assistant."),
+        ChatCompletionUserMessageParam(role="user", content=prompt)
+    ]
+
+def ask_gpt(prompt: str, context: str = "", model: str = "gpt-3.5-turbo", temperature: float = 0.3) -> str:
+    key = _cache_key(prompt, context, model, temperature)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
 
-        response = client.chat.completions.create(
+    try:
+        messages = _build_messages(prompt)
+
+        response = _get_client().chat.completions.create(
             model=model,
             messages=messages,
             temperature=temperature
         )
 
-        return response.choices[0].message.content.strip()
+        answer = response.choices[0].message.content.strip()
+        _cache_set(key, answer)
+        return answer
+
+    except Exception as e:
+        return f"⚠️ Error: {str(e)}"
+
+async def _ask_one(
+    client: AsyncOpenAI,
+    semaphore: asyncio.Semaphore,
+    prompt: str,
+    model: str,
+    temperature: float
+) -> str:
+    key = _cache_key(prompt, "", model, temperature)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        async with semaphore:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=_build_messages(prompt),
+                temperature=temperature
+            )
+
+        answer = response.choices[0].message.content.strip()
+        _cache_set(key, answer)
+        return answer
 
     except Exception as e:
         return f"⚠️ Error: {str(e)}"
+
+async def _ask_all(prompts: List[str], model: str, temperature: float, max_concurrency: int) -> List[str]:
+    # The async client is scoped to one event loop, so it is created per batch
+    async with AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")) as client:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        return await asyncio.gather(*[
+            _ask_one(client, semaphore, prompt, model, temperature)
+            for prompt in prompts
+        ])
+
+def ask_gpt_batch(
+    prompts: List[str],
+    model: str = "gpt-3.5-turbo",
+    temperature: float = 0.3,
+    max_concurrency: int = 8
+) -> List[str]:
+    """Ask several independent prompts concurrently.
+
+    Answers are returned in the same order as prompts. A failed prompt
+    yields an error string, as with ask_gpt, without failing the batch.
+    """
+    if not prompts:
+        return []
+    return asyncio.run(_ask_all(prompts, model, temperature, max_concurrency))
+
+
+if __name__ == "__main__":
+    healthcheck()
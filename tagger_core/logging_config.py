@@ -5,13 +5,95 @@ This module provides structured logging with JSON format support for
 production environments and human-readable format for development.
 """
 
+import atexit
+import copy
 import logging
 import json
+import queue
 import sys
-from datetime import datetime
-from typing import Dict, Any
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Any, Optional
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log payload, using orjson when it is installed.
+
+    Args:
+        data: Log payload
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            # orjson is stricter (e.g. non-string keys); let json decide
+            pass
+    return json.dumps(data)
+
+
+# Background thread that writes queued records to the real handlers
+_queue_listener: Optional[QueueListener] = None
+
+# Renders tracebacks before records are queued (see _LogQueueHandler)
+_exception_formatter = logging.Formatter()
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records, stop the logging thread and close its handlers."""
+    global _queue_listener
+
+    if _queue_listener is None:
+        return
+
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        handler.close()
+    _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+class _LogQueueHandler(QueueHandler):
+    """QueueHandler that keeps records structured for the real formatters.
+
+    The stock prepare() renders the whole record, traceback included, into
+    the message. Here only the message arguments are merged (so later
+    changes to them cannot alter the log line) and the traceback is
+    rendered into exc_text, which both formatters read, so JSON logs keep
+    a separate "exception" field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare a record for the queue.
+
+        Args:
+            record: Log record to enqueue
+
+        Returns:
+            Copy of the record that is safe to format on another thread
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
 
 class LogFormat(Enum):
     """Supported log formats."""
@@ -19,13 +101,56 @@ class LogFormat(Enum):
     JSON = "json"
 
 
-class JSONFormatter(logging.Formatter):
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats each second's timestamp only once.
+
+    Records logged within the same second share their date/time text, so
+    converting and strftime-ing the timestamp is done once per second
+    instead of once per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, datefmt, formatted) -- replaced as a whole so concurrent
+        # handlers never see a second paired with another second's text
+        self._cached_time = (-1, None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
+        """Format the record's creation time, reusing the last result.
+
+        Args:
+            record: Log record to format
+            datefmt: strftime format (None uses the logging default)
+
+        Returns:
+            Formatted date/time string
+        """
+        if datefmt is None:
+            # The default format includes milliseconds, so it cannot be shared
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._cached_time
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(datefmt, self.converter(second))
+            self._cached_time = (second, datefmt, formatted)
+        return formatted
+
+
+class JSONFormatter(_CachedTimeFormatter):
     """Custom formatter that outputs logs in JSON format.
 
     This is ideal for production environments where logs are ingested by
     centralized logging systems (CloudWatch, ELK, Datadog, etc.).
     """
 
+    # Timestamps are UTC
+    converter = time.gmtime
+
+    def __init__(self):
+        """Initialize JSON formatter."""
+        super().__init__(datefmt="%Y-%m-%dT%H:%M:%S")
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
 
@@ -36,7 +161,10 @@ class JSONFormatter(logging.Formatter):
             JSON string representation of the log
         """
         log_data = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": "%s.%06dZ" % (
+                self.formatTime(record, self.datefmt),
+                int(record.created % 1 * 1_000_000)
+            ),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -45,18 +173,20 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add exception info if present
+        # Add exception info if present (queued records carry it pre-rendered)
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
 
         # Add extra fields if present
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
-        return json.dumps(log_data)
+        return _dumps(log_data)
 
 
-class TextFormatter(logging.Formatter):
+class TextFormatter(_CachedTimeFormatter):
     """Custom formatter for human-readable text logs.
 
     This is ideal for development and debugging.
@@ -78,12 +208,29 @@ class TextFormatter(logging.Formatter):
         Args:
             use_colors: Whether to use colored output (default: True)
         """
-        super().__init__(
-            fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        fmt = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        datefmt = '%Y-%m-%d %H:%M:%S'
+        super().__init__(fmt=fmt, datefmt=datefmt)
         self.use_colors = use_colors
 
+        # Checked once here rather than on every record (isatty is a syscall)
+        self._is_tty = sys.stdout.isatty()
+
+        # One formatter per level with the color codes baked into the format
+        # string, so records are never modified (other handlers share them)
+        self._color_formatters: Dict[str, logging.Formatter] = {}
+        if self.use_colors and self._is_tty:
+            reset = self.COLORS['RESET']
+            for level_name, level_color in self.COLORS.items():
+                if level_name == 'RESET':
+                    continue
+                colored_fmt = fmt.replace(
+                    '%(levelname)s', f"{level_color}%(levelname)s{reset}"
+                )
+                self._color_formatters[level_name] = _CachedTimeFormatter(
+                    fmt=colored_fmt, datefmt=datefmt
+                )
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as colored text.
 
@@ -93,11 +240,9 @@ class TextFormatter(logging.Formatter):
         Returns:
             Formatted log string
         """
-        if self.use_colors and sys.stdout.isatty():
-            # Add color codes
-            level_color = self.COLORS.get(record.levelname, '')
-            reset = self.COLORS['RESET']
-            record.levelname = f"{level_color}{record.levelname}{reset}"
+        color_formatter = self._color_formatters.get(record.levelname)
+        if color_formatter is not None:
+            return color_formatter.format(record)
 
         return super().format(record)
 
@@ -109,6 +254,12 @@ def setup_logging(
 ) -> None:
     """Configure application-wide logging.
 
+    Log calls only put the record on an in-memory queue; a background
+    thread formats it and writes it to the console and log file, so
+    scanner threads never block on I/O. Output is therefore flushed
+    asynchronously. Queued records are written out at interpreter exit
+    or when logging is configured again.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         format_type: Log format ("text" or "json")
@@ -127,11 +278,14 @@ def setup_logging(
         )
         ```
     """
+    global _queue_listener
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
 
-    # Remove existing handlers
+    # Remove existing handlers, flushing anything still queued
+    _stop_queue_listener()
     root_logger.handlers.clear()
 
     # Choose formatter
@@ -143,13 +297,19 @@ def setup_logging(
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if specified)
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Handlers run on the listener thread; the root logger only enqueues
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    root_logger.addHandler(_LogQueueHandler(log_queue))
 
     # Set logging levels for noisy libraries
     logging.getLogger("boto3").setLevel(logging.WARNING)
@@ -173,11 +333,13 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-class StructuredLogger:
+class StructuredLogger(logging.LoggerAdapter):
     """Wrapper for logging with structured fields.
 
     This class makes it easy to add structured context to log messages
-    for better searchability in log aggregation systems.
+    for better searchability in log aggregation systems. Being a
+    LoggerAdapter, calls below the logger's level return before any
+    record is built.
 
     Example:
         ```python
@@ -200,54 +362,19 @@ class StructuredLogger:
         Args:
             name: Logger name
         """
-        self.logger = logging.getLogger(name)
+        super().__init__(logging.getLogger(name), {})
 
-    def _log(
-        self,
-        level: int,
-        message: str,
-        extra: Dict[str, Any] = None,
-        exc_info: bool = False
-    ) -> None:
-        """Internal logging method with structured fields.
+    def process(self, msg: Any, kwargs: Dict[str, Any]):
+        """Move the caller's extra fields to where JSONFormatter reads them.
 
         Args:
-            level: Log level
-            message: Log message
-            extra: Extra structured fields
-            exc_info: Include exception information
-        """
-        record = self.logger.makeRecord(
-            self.logger.name,
-            level,
-            "(structured)",
-            0,
-            message,
-            (),
-            exc_info=exc_info if exc_info else None
-        )
+            msg: Log message
+            kwargs: Keyword arguments of the logging call
 
+        Returns:
+            Tuple of (msg, kwargs) to pass on to the logger
+        """
+        extra = kwargs.pop("extra", None)
         if extra:
-            record.extra_fields = extra
-
-        self.logger.handle(record)
-
-    def debug(self, message: str, extra: Dict[str, Any] = None) -> None:
-        """Log debug message with structured fields."""
-        self._log(logging.DEBUG, message, extra)
-
-    def info(self, message: str, extra: Dict[str, Any] = None) -> None:
-        """Log info message with structured fields."""
-        self._log(logging.INFO, message, extra)
-
-    def warning(self, message: str, extra: Dict[str, Any] = None) -> None:
-        """Log warning message with structured fields."""
-        self._log(logging.WARNING, message, extra)
-
-    def error(self, message: str, extra: Dict[str, Any] = None, exc_info: bool = False) -> None:
-        """Log error message with structured fields."""
-        self._log(logging.ERROR, message, extra, exc_info=exc_info)
-
-    def critical(self, message: str, extra: Dict[str, Any] = None, exc_info: bool = False) -> None:
-        """Log critical message with structured fields."""
-        self._log(logging.CRITICAL, message, extra, exc_info=exc_info)
+            kwargs["extra"] = {"extra_fields": extra}
+        return msg, kwargs
@@ -6,16 +6,157 @@ easy extension to new resource types (EC2, Lambda, S3, RDS, etc.).
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterator, Iterable, Mapping, Type
 from enum import Enum
+import sys
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import logging
 from functools import lru_cache
+from operator import itemgetter
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    retry_if_exception_type
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Clients created from caller-provided sessions, cached per session so
+# scanners sharing a session also share its clients. The lock also keeps
+# concurrent scanners from calling Session.client(), which is not
+# thread-safe, at the same time.
+_session_clients: "weakref.WeakKeyDictionary[boto3.Session, Dict[Tuple[str, str], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_session_clients_lock = threading.Lock()
+
+
+@lru_cache(maxsize=256)
+def _frozen_tags_to_aws_format(
+    frozen_tags: Tuple[Tuple[str, str], ...]
+) -> Tuple[Dict[str, str], ...]:
+    """Convert sorted (key, value) pairs into Key/Value tag dicts."""
+    return tuple({"Key": k, "Value": v} for k, v in frozen_tags)
+
+
+def tags_to_aws_format(tags: Dict[str, str]) -> Tuple[Dict[str, str], ...]:
+    """Convert a tag dictionary into the Key/Value list used by AWS APIs.
+
+    Bulk tagging usually applies the same tag set to many resources, so the
+    conversion is cached per unique tag set. Tags are sorted by key so the
+    request is identical regardless of dict insertion order. boto3 accepts
+    any sequence for list parameters, so the cached tuple is passed through
+    directly.
+
+    Args:
+        tags: Dictionary of tags
+
+    Returns:
+        Tuple of {"Key": ..., "Value": ...} dicts
+    """
+    return _frozen_tags_to_aws_format(tuple(sorted(tags.items())))
+
+
+_tag_key_value = itemgetter("Key", "Value")
+
+
+def tags_from_aws_format(aws_tags: Iterable[Dict[str, str]]) -> Dict[str, str]:
+    """Convert the Key/Value tag list returned by AWS APIs into a dictionary.
+
+    Args:
+        aws_tags: Iterable of {"Key": ..., "Value": ...} dicts
+
+    Returns:
+        Dictionary of tags
+    """
+    return dict(map(_tag_key_value, aws_tags))
+
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Client settings shared by all scanners: keep pooled connections alive
+# between scans, allow enough of them for concurrent requests, and let
+# botocore retry individual throttled calls with adaptive rate limiting.
+# Worker pools in the scanners are capped at max_pool_connections; raise it
+# here before running more concurrent requests per client, or the extra
+# requests open fresh TCP/TLS connections instead of reusing pooled ones.
+# Timeouts are tighter than botocore's 60s defaults so a stalled connection
+# is retried instead of holding up a scan (read timeout matches
+# AWSConfig.request_timeout).
+DEFAULT_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=30,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    user_agent_extra='aws-tagsense'
+)
+
+
+# Retry policy for tagging calls, shared by every scanner. botocore already
+# retries throttled requests inside each call; this outer retry also covers
+# other transient ClientErrors on writes.
+aws_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_exception_type(ClientError),
+    reraise=True
+)
+
+
+@lru_cache(maxsize=None)
+def _shared_session(profile: Optional[str]) -> boto3.Session:
+    """Get a process-wide boto3 session for a profile.
+
+    Building a session resolves credentials and loads configuration, so
+    one session per profile is reused for every region and service.
+
+    Args:
+        profile: AWS profile name (optional)
+
+    Returns:
+        boto3 session
+    """
+    if profile:
+        return boto3.Session(profile_name=profile)
+    return boto3.Session()
+
+
+@lru_cache(maxsize=256)
+def _shared_client(service_name: str, region: str, profile: Optional[str]):
+    """Get a process-wide client for a service, region and profile.
+
+    Scanners created without an explicit session reuse these clients, so
+    their HTTP connection pools and TLS sessions survive across scanner
+    instances instead of being rebuilt for every scan.
+
+    Args:
+        service_name: boto3 service name (ec2, lambda, ...)
+        region: AWS region
+        profile: AWS profile name (optional)
+
+    Returns:
+        boto3 client
+    """
+    session = _shared_session(profile)
+    # Session.client() is not thread-safe
+    with _session_clients_lock:
+        return session.client(
+            service_name,
+            region_name=region,
+            config=DEFAULT_CLIENT_CONFIG
+        )
+
 
 class ResourceType(Enum):
     """Supported AWS resource types."""
@@ -26,7 +167,57 @@ class ResourceType(Enum):
     EBS = "EBS"
 
 
-@dataclass
+class LazyTags(Mapping[str, str]):
+    """Read-only tag mapping that is fetched on first access.
+
+    Scanners use this when tags need a separate API call per resource, so
+    discovery can skip those calls entirely unless the tags are read.
+
+    Example:
+        ```python
+        tags = LazyTags(lambda: client.list_tags(Resource=arn)['Tags'])
+        tags.get("Environment")  # ListTags is called here, once
+        ```
+    """
+
+    __slots__ = ('_loader', '_tags')
+
+    def __init__(self, loader: Callable[[], Dict[str, str]]):
+        """Initialize lazy tags.
+
+        Args:
+            loader: Callable returning the tag dictionary
+        """
+        self._loader = loader
+        self._tags = None
+
+    @property
+    def loaded(self) -> bool:
+        """Check if the tags have been fetched."""
+        return self._tags is not None
+
+    def _load(self) -> Dict[str, str]:
+        if self._tags is None:
+            self._tags = self._loader()
+            self._loader = None
+        return self._tags
+
+    def __getitem__(self, key: str) -> str:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        if self._tags is None:
+            return "LazyTags(<not loaded>)"
+        return f"LazyTags({self._tags!r})"
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class AWSResource:
     """Represents an AWS resource with its tagging status.
 
@@ -34,37 +225,38 @@ class AWSResource:
         resource_id: The unique identifier (instance ID, function name, etc.)
         resource_type: Type of resource
         region: AWS region
-        tags: Dictionary of current tags
+        tags: Current tags (a LazyTags mapping if fetched on first access)
         state: Resource state (running, stopped, etc.)
         metadata: Additional resource-specific metadata
     """
     resource_id: str
     resource_type: ResourceType
     region: str
-    tags: Dict[str, str]
+    tags: Mapping[str, str]
     state: str
-    metadata: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     @property
     def is_tagged(self) -> bool:
         """Check if resource has any tags."""
         return len(self.tags) > 0
 
-    @property
-    def has_required_tags(self, required_tags: List[str]) -> bool:
+    def has_required_tags(self, required_tags: Iterable[str]) -> bool:
         """Check if resource has all required tags.
 
+        When checking many resources, pass a set or frozenset so it is not
+        rebuilt for every resource.
+
         Args:
-            required_tags: List of required tag keys
+            required_tags: Required tag keys
 
         Returns:
             True if all required tags are present
         """
-        return all(tag in self.tags for tag in required_tags)
+        if not isinstance(required_tags, (set, frozenset)):
+            required_tags = frozenset(required_tags)
+        # Key views compare against sets by membership, one lookup per key
+        return self.tags.keys() >= required_tags
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -72,30 +264,64 @@ class AWSResource:
             "resource_id": self.resource_id,
             "resource_type": self.resource_type.value,
             "region": self.region,
-            "tags": self.tags,
+            "tags": dict(self.tags),
             "state": self.state,
             "metadata": self.metadata
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ScanResult:
     """Results from scanning a set of AWS resources.
 
+    The tagged/untagged split is computed in one pass the first time either
+    list (or the compliance rate) is read, so callers that only need the
+    resources or the total never pay for it.
+
     Attributes:
         resource_type: Type of resources scanned
         region: AWS region scanned
+        resources: List of all scanned resources
         total_resources: Total number of resources found
         tagged_resources: Resources with at least one tag
         untagged_resources: Resources with no tags
-        resources: List of all scanned resources
     """
     resource_type: ResourceType
     region: str
-    total_resources: int
-    tagged_resources: List[AWSResource]
-    untagged_resources: List[AWSResource]
     resources: List[AWSResource]
+    _tagged: Optional[List[AWSResource]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _untagged: Optional[List[AWSResource]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _partition(self) -> None:
+        """Split resources into tagged and untagged lists (once)."""
+        if self._tagged is not None:
+            return
+
+        tagged, untagged = [], []
+        for resource in self.resources:
+            (tagged if resource.is_tagged else untagged).append(resource)
+        self._tagged, self._untagged = tagged, untagged
+
+    @property
+    def total_resources(self) -> int:
+        """Total number of resources found."""
+        return len(self.resources)
+
+    @property
+    def tagged_resources(self) -> List[AWSResource]:
+        """Resources with at least one tag."""
+        self._partition()
+        return self._tagged
+
+    @property
+    def untagged_resources(self) -> List[AWSResource]:
+        """Resources with no tags."""
+        self._partition()
+        return self._untagged
 
     @property
     def tagging_compliance_rate(self) -> float:
@@ -104,6 +330,36 @@ class ScanResult:
             return 0.0
         return (len(self.tagged_resources) / self.total_resources) * 100
 
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Convert the resources to a column-oriented dictionary.
+
+        Holds one list per field instead of one dict per resource, and can
+        be handed straight to pandas.DataFrame or pyarrow.Table.from_pydict
+        for CSV/Parquet export. Each metadata key gets its own column (None
+        where a resource lacks it); keys that collide with a resource field
+        are left out.
+
+        Returns:
+            Mapping of column name to a list with one value per resource
+        """
+        resources = self.resources
+        columns: Dict[str, List[Any]] = {
+            "resource_id": [r.resource_id for r in resources],
+            "resource_type": [r.resource_type.value for r in resources],
+            "region": [r.region for r in resources],
+            "state": [r.state for r in resources],
+            "tags": [dict(r.tags) for r in resources],
+        }
+
+        metadata_keys = dict.fromkeys(
+            key for r in resources for key in r.metadata
+        )
+        for key in metadata_keys:
+            if key not in columns:
+                columns[key] = [r.metadata.get(key) for r in resources]
+
+        return columns
+
 
 class BaseResourceScanner(ABC):
     """Abstract base class for AWS resource scanners.
@@ -116,19 +372,39 @@ class BaseResourceScanner(ABC):
     - Filtering by tag status
     - Applying tags
     - Caching scan results
+
+    Scanners own a worker pool that is created on first use and reused by
+    every later scan. Call close() (or use the scanner as a context manager)
+    to release its threads early; otherwise they exit when the scanner is
+    garbage collected.
     """
 
-    def __init__(self, region: str, profile: Optional[str] = None):
+    # Threads in the scanner's worker pool (never more than the client's
+    # pooled connections, see _get_executor)
+    MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        region: str,
+        profile: Optional[str] = None,
+        session: Optional[boto3.Session] = None
+    ):
         """Initialize the resource scanner.
 
         Args:
             region: AWS region to scan
             profile: AWS profile name (optional)
+            session: Existing boto3 session to reuse (optional). Sharing one
+                     session across scanners for many regions avoids repeating
+                     credential resolution and config parsing per scanner.
         """
         self.region = region
         self.profile = profile
-        self._session = None
+        self._session = session
+        self._session_provided = session is not None
         self._client = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     @property
     def session(self) -> boto3.Session:
@@ -143,6 +419,67 @@ class BaseResourceScanner(ABC):
                 self._session = boto3.Session(region_name=self.region)
         return self._session
 
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the scanner's worker pool, creating it on first use.
+
+        Reusing one pool keeps its threads, and the per-thread state botocore
+        builds in them, warm across scans instead of starting new threads
+        for every scan or page.
+
+        Returns:
+            ThreadPoolExecutor with at most MAX_WORKERS threads
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                max_workers = min(
+                    self.MAX_WORKERS,
+                    DEFAULT_CLIENT_CONFIG.max_pool_connections
+                )
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=f"{type(self).__name__}-{self.region}"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the scanner's worker pool, if one was started."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Use the scanner as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the scanner's worker pool."""
+        self.close()
+
+    def _create_client(self, service_name: str):
+        """Create a boto3 client for this scanner's region.
+
+        Args:
+            service_name: boto3 service name (ec2, lambda, ...)
+
+        Returns:
+            boto3 client, shared with every other scanner using the same
+            session (or the same profile if no session was provided)
+        """
+        if not self._session_provided:
+            return _shared_client(service_name, self.region, self.profile)
+
+        key = (service_name, self.region)
+        with _session_clients_lock:
+            clients = _session_clients.setdefault(self._session, {})
+            if key not in clients:
+                clients[key] = self._session.client(
+                    service_name,
+                    region_name=self.region,
+                    config=DEFAULT_CLIENT_CONFIG
+                )
+            return clients[key]
+
     @property
     @abstractmethod
     def client(self):
@@ -165,6 +502,22 @@ class BaseResourceScanner(ABC):
         """
         pass
 
+    def scan_iter(self) -> Iterator[AWSResource]:
+        """Yield resources in the configured region one at a time.
+
+        Use this when resources are only counted, filtered or written out,
+        so the whole region never has to be held in memory. Scanners that
+        can stream from the paginator override this; the default falls back
+        to scan().
+
+        Yields:
+            AWSResource for each resource found
+
+        Raises:
+            AWSError: If the scan fails
+        """
+        yield from self.scan().resources
+
     @abstractmethod
     def apply_tags(self, resource_id: str, tags: Dict[str, str]) -> bool:
         """Apply tags to a specific resource.
@@ -215,7 +568,8 @@ class BaseResourceScanner(ABC):
         Returns:
             List of resources missing required tags
         """
-        return [r for r in resources if not r.has_required_tags(required_tags)]
+        required = frozenset(required_tags)
+        return [r for r in resources if not r.has_required_tags(required)]
 
     def __repr__(self) -> str:
         """Developer-friendly representation."""
@@ -224,3 +578,48 @@ class BaseResourceScanner(ABC):
             f"resource_type={self.get_resource_type().value}, "
             f"region={self.region})"
         )
+
+
+def scan_regions(
+    scanner_cls: Type[BaseResourceScanner],
+    regions: List[str],
+    profile: Optional[str] = None,
+    max_workers: int = 8
+) -> Dict[str, ScanResult]:
+    """Scan several regions concurrently with one scanner per region.
+
+    Regions share no state, so the total time is roughly that of the
+    slowest region rather than the sum of all of them. Scanners reuse the
+    process-wide session and clients for the profile.
+
+    Args:
+        scanner_cls: Scanner class to instantiate (e.g. EC2Scanner)
+        regions: AWS regions to scan
+        profile: AWS profile name (optional)
+        max_workers: Maximum number of regions scanned at once
+
+    Returns:
+        Mapping of region to its ScanResult, in the order of regions
+
+    Raises:
+        ClientError: If scanning any region fails after retries
+    """
+    def scan_region(region: str) -> ScanResult:
+        with scanner_cls(region=region, profile=profile) as scanner:
+            return scanner.scan()
+
+    if not regions:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(regions))) as executor:
+        futures = {region: executor.submit(scan_region, region) for region in regions}
+
+        results = {}
+        for region, future in futures.items():
+            try:
+                results[region] = future.result()
+            except Exception as e:
+                logger.error("Scan of %s failed: %s", region, e)
+                raise
+
+    return results